@@ -13,4 +13,5 @@ class StadiumAdmin(admin.ModelAdmin):
 class PitchAdmin(admin.ModelAdmin):
     list_display = ("name", "stadium", "surface_type", "current_condition")
     list_filter = ("surface_type", "current_condition", "stadium")
+    list_select_related = ("stadium",)
     search_fields = ("name", "stadium__name")
@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.contrib.gis.geos import Point, Polygon
-from geo.models import Stadium, Pitch
+from django.db import transaction
+from geo.models import Stadium, Pitch, SurfaceType, PitchCondition
 
 class Command(BaseCommand):
     help = "Seed 10 famous international cricket stadiums (excluding India) with sample pitches"
@@ -19,16 +20,29 @@ class Command(BaseCommand):
             {"name": "Newlands", "country": "South Africa", "coords": (-33.9460, 18.4647)},
         ]
 
-        for data in stadiums_data:
-            stadium, created = Stadium.objects.get_or_create(
-                name=data["name"],
-                defaults={
-                    "country": data["country"],
-                    "location": Point(data["coords"][1], data["coords"][0])  # lon, lat
-                }
+        names = [data["name"] for data in stadiums_data]
+        # Only used for reporting; the upserts below are idempotent on their own
+        existing = set(Stadium.objects.filter(name__in=names).values_list("name", flat=True))
+
+        with transaction.atomic():
+            stadiums = Stadium.objects.bulk_create(
+                [
+                    Stadium(
+                        name=data["name"],
+                        country=data["country"],
+                        location=Point(data["coords"][1], data["coords"][0], srid=4326),  # lon, lat
+                    )
+                    for data in stadiums_data
+                ],
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=["name"],
+                update_fields=["country", "location"],
             )
 
-            if created:
+            # bulk_create sets PKs on Postgres, so the pitches can reference the stadiums
+            pitches = []
+            for stadium, data in zip(stadiums, stadiums_data):
                 # Create a sample pitch polygon around the stadium centroid
                 lat, lon = data["coords"]
                 delta = 0.0003  # small area around the centroid
@@ -38,17 +52,28 @@ class Command(BaseCommand):
                     (lon + delta, lat + delta),
                     (lon + delta, lat - delta),
                     (lon - delta, lat - delta),
-                ))
+                ), srid=4326)
 
-                Pitch.objects.create(
+                pitches.append(Pitch(
                     stadium=stadium,
                     name="Main Pitch",
                     area=polygon,
-                    centroid=stadium.location,
-                    surface_type="grass",
-                    current_condition="balanced"
-                )
+                    centroid=Pitch.centroid_for(polygon),  # bulk_create skips Pitch.save()
+                    surface_type=SurfaceType.GRASS,
+                    current_condition=PitchCondition.BALANCED
+                ))
 
-                self.stdout.write(self.style.SUCCESS(f"Created stadium and pitch: {stadium.name}"))
+            # Re-seeding refreshes the geometry but leaves any edited pitch condition alone
+            Pitch.objects.bulk_create(
+                pitches,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=["stadium", "name"],
+                update_fields=["area", "centroid"],
+            )
+
+        for stadium in stadiums:
+            if stadium.name in existing:
+                self.stdout.write(f"Updated stadium: {stadium.name}")
             else:
-                self.stdout.write(f"Stadium already exists: {stadium.name}")
+                self.stdout.write(self.style.SUCCESS(f"Created stadium and pitch: {stadium.name}"))
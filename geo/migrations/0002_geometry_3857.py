@@ -0,0 +1,50 @@
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+
+def transform_column(table, column, geom_type):
+    """Convert a geography(4326) column to geometry(3857), keeping its data."""
+    return migrations.RunSQL(
+        sql=(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE geometry({geom_type}, 3857) "
+            f"USING ST_Transform(ST_SetSRID({column}::geometry, 4326), 3857);"
+        ),
+        reverse_sql=(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE geography({geom_type}, 4326) "
+            f"USING ST_Transform({column}, 4326)::geography;"
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geo', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                transform_column('geo_stadium', 'location', 'Point'),
+                transform_column('geo_pitch', 'area', 'Polygon'),
+                transform_column('geo_pitch', 'centroid', 'Point'),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='stadium',
+                    name='location',
+                    field=django.contrib.gis.db.models.fields.PointField(blank=True, null=True, srid=3857),
+                ),
+                migrations.AlterField(
+                    model_name='pitch',
+                    name='area',
+                    field=django.contrib.gis.db.models.fields.PolygonField(blank=True, null=True, srid=3857),
+                ),
+                migrations.AlterField(
+                    model_name='pitch',
+                    name='centroid',
+                    field=django.contrib.gis.db.models.fields.PointField(blank=True, null=True, srid=3857),
+                ),
+            ],
+        ),
+    ]
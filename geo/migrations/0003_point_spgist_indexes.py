@@ -0,0 +1,31 @@
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geo', '0002_geometry_3857'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='stadium',
+            name='location',
+            field=django.contrib.gis.db.models.fields.PointField(blank=True, null=True, spatial_index=False, srid=3857),
+        ),
+        migrations.AlterField(
+            model_name='pitch',
+            name='centroid',
+            field=django.contrib.gis.db.models.fields.PointField(blank=True, null=True, spatial_index=False, srid=3857),
+        ),
+        migrations.AddIndex(
+            model_name='stadium',
+            index=django.contrib.postgres.indexes.SpGistIndex(fields=['location'], name='stadium_location_spgist'),
+        ),
+        migrations.AddIndex(
+            model_name='pitch',
+            index=django.contrib.postgres.indexes.SpGistIndex(fields=['centroid'], name='pitch_centroid_spgist'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geo', '0003_point_spgist_indexes'),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        migrations.AlterField(
+            model_name='pitch',
+            name='area',
+            field=django.contrib.gis.db.models.fields.PolygonField(blank=True, null=True, spatial_index=False, srid=3857),
+        ),
+        migrations.AddIndex(
+            model_name='pitch',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['stadium', 'area'], name='pitch_stadium_area_gist'),
+        ),
+    ]
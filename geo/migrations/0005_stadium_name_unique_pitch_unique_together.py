@@ -0,0 +1,47 @@
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_no_duplicates(apps, schema_editor):
+    """Fail with a readable list instead of a bare IntegrityError on the unique constraints."""
+    Stadium = apps.get_model('geo', 'Stadium')
+    Pitch = apps.get_model('geo', 'Pitch')
+
+    problems = []
+    dup_stadiums = (
+        Stadium.objects.values('name').annotate(n=Count('id')).filter(n__gt=1).order_by('name')
+    )
+    for row in dup_stadiums:
+        problems.append(f"stadium name {row['name']!r} is used {row['n']} times")
+    dup_pitches = (
+        Pitch.objects.values('stadium_id', 'name').annotate(n=Count('id')).filter(n__gt=1)
+        .order_by('stadium_id', 'name')
+    )
+    for row in dup_pitches:
+        problems.append(f"stadium {row['stadium_id']} has {row['n']} pitches named {row['name']!r}")
+
+    if problems:
+        raise RuntimeError(
+            "Rename or merge these rows before making stadium/pitch names unique:\n  "
+            + "\n  ".join(problems)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geo', '0004_pitch_stadium_area_gist'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_no_duplicates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='stadium',
+            name='name',
+            field=models.CharField(max_length=255, unique=True),
+        ),
+        migrations.AlterUniqueTogether(
+            name='pitch',
+            unique_together={('stadium', 'name')},
+        ),
+    ]
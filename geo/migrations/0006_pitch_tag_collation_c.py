@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geo', '0005_stadium_name_unique_pitch_unique_together'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pitch',
+            name='surface_type',
+            field=models.CharField(choices=[('grass', 'Grass'), ('dry', 'Dry'), ('dusty', 'Dusty'), ('green', 'Green Top'), ('artificial', 'Artificial')], db_collation='C', default='grass', max_length=32),
+        ),
+        migrations.AlterField(
+            model_name='pitch',
+            name='current_condition',
+            field=models.CharField(blank=True, choices=[('batting_friendly', 'Batting friendly'), ('bowling_friendly', 'Bowling friendly'), ('balanced', 'Balanced')], db_collation='C', max_length=32, null=True),
+        ),
+    ]
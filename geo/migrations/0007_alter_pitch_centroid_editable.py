@@ -0,0 +1,18 @@
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('geo', '0006_pitch_tag_collation_c'),
+    ]
+
+    operations = [
+        # editable only affects forms; no SQL is emitted
+        migrations.AlterField(
+            model_name='pitch',
+            name='centroid',
+            field=django.contrib.gis.db.models.fields.PointField(blank=True, editable=False, null=True, spatial_index=False, srid=3857),
+        ),
+    ]
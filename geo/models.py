@@ -1,26 +1,33 @@
 from django.contrib.gis.db import models
+from django.contrib.postgres.indexes import GistIndex, SpGistIndex
+from django.db.models import DEFERRED
 
-SURFACE_CHOICES = [
-    ("grass", "Grass"),
-    ("dry", "Dry"),
-    ("dusty", "Dusty"),
-    ("green", "Green Top"),
-    ("artificial", "Artificial"),
-]
 
-PITCH_CONDITION_CHOICES = [
-    ("batting_friendly", "Batting friendly"),
-    ("bowling_friendly", "Bowling friendly"),
-    ("balanced", "Balanced"),
-]
+class SurfaceType(models.TextChoices):
+    GRASS = "grass", "Grass"
+    DRY = "dry", "Dry"
+    DUSTY = "dusty", "Dusty"
+    GREEN = "green", "Green Top"
+    ARTIFICIAL = "artificial", "Artificial"
+
+
+class PitchCondition(models.TextChoices):
+    BATTING_FRIENDLY = "batting_friendly", "Batting friendly"
+    BOWLING_FRIENDLY = "bowling_friendly", "Bowling friendly"
+    BALANCED = "balanced", "Balanced"
 
 
 class Stadium(models.Model):
     """Cricket stadium with location info."""
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, unique=True)
     city = models.CharField(max_length=120, blank=True, null=True)
     country = models.CharField(max_length=80, blank=True, null=True)
-    location = models.PointField(geography=True, blank=True, null=True)  # stadium centroid
+    location = models.PointField(srid=3857, spatial_index=False, blank=True, null=True)  # stadium centroid, Web Mercator
+
+    class Meta:
+        indexes = [
+            SpGistIndex(fields=["location"], name="stadium_location_spgist"),
+        ]
 
     def __str__(self):
         return self.name
@@ -30,10 +37,54 @@ class Pitch(models.Model):
     """Specific pitch within a stadium for visualization."""
     stadium = models.ForeignKey(Stadium, on_delete=models.CASCADE, related_name="pitches")
     name = models.CharField(max_length=120, default="Main")
-    area = models.PolygonField(geography=True, blank=True, null=True)
-    centroid = models.PointField(geography=True, blank=True, null=True)
-    surface_type = models.CharField(max_length=32, choices=SURFACE_CHOICES, default="grass")
-    current_condition = models.CharField(max_length=32, choices=PITCH_CONDITION_CHOICES, blank=True, null=True)
+    area = models.PolygonField(srid=3857, spatial_index=False, blank=True, null=True)
+    # Derived from area in save(); a centroid on a pitch that never had an area is left as is
+    centroid = models.PointField(srid=3857, spatial_index=False, blank=True, null=True, editable=False)
+    # Tags are plain ASCII, so byte-wise "C" collation is safe and makes equality filters cheaper
+    surface_type = models.CharField(
+        max_length=32, choices=SurfaceType.choices, default=SurfaceType.GRASS, db_collation="C"
+    )
+    current_condition = models.CharField(
+        max_length=32, choices=PitchCondition.choices, blank=True, null=True, db_collation="C"
+    )
+
+    class Meta:
+        unique_together = ("stadium", "name")
+        indexes = [
+            SpGistIndex(fields=["centroid"], name="pitch_centroid_spgist"),
+            # serves "pitches of this stadium within a bbox" from one index (needs btree_gist)
+            GistIndex(fields=["stadium", "area"], name="pitch_stadium_area_gist"),
+        ]
+
+    # Whether the row had an area when loaded, so save() can tell "cleared" from "never set"
+    _had_area = False
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        area = dict(zip(field_names, values)).get("area", DEFERRED)
+        instance._had_area = area is not None and area is not DEFERRED
+        return instance
+
+    @classmethod
+    def centroid_for(cls, area):
+        """Centroid of ``area`` in the column SRID, matching what save() stores."""
+        srid = cls._meta.get_field("centroid").srid
+        if area.srid is not None and area.srid != srid:
+            area = area.transform(srid, clone=True)
+        return area.centroid
+
+    def save(self, *args, **kwargs):
+        # Keep the stored centroid in step with the polygon so reads never need ST_Centroid
+        if self.area is not None:
+            self.centroid = self.centroid_for(self.area)
+        elif self._had_area:
+            self.centroid = None
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "area" in update_fields and "centroid" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "centroid"]
+        super().save(*args, **kwargs)
+        self._had_area = self.area is not None
 
     def __str__(self):
         return f"{self.stadium.name} — {self.name}"
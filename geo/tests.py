@@ -1,3 +1,83 @@
+from io import StringIO
+
+from django.contrib.gis.geos import Point, Polygon
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Pitch, PitchCondition, Stadium
+
+
+class SeedStadiumsTests(TestCase):
+    def seed(self):
+        out = StringIO()
+        call_command("seed_stadiums", stdout=out)
+        return out.getvalue()
+
+    def test_reseed_is_idempotent_and_keeps_edited_condition(self):
+        self.seed()
+        self.assertEqual(Stadium.objects.count(), 10)
+        self.assertEqual(Pitch.objects.count(), 10)
+
+        pitch = Pitch.objects.get(stadium__name="Eden Park", name="Main Pitch")
+        pitch.current_condition = PitchCondition.BOWLING_FRIENDLY
+        pitch.save()
+
+        output = self.seed()
+        self.assertEqual(Stadium.objects.count(), 10)
+        self.assertEqual(Pitch.objects.count(), 10)
+        self.assertIn("Updated stadium: Eden Park", output)
+
+        pitch.refresh_from_db()
+        self.assertEqual(pitch.current_condition, PitchCondition.BOWLING_FRIENDLY)
+
+    def test_seeded_centroid_matches_area(self):
+        self.seed()
+        for pitch in Pitch.objects.all():
+            expected = pitch.area.centroid
+            self.assertAlmostEqual(pitch.centroid.x, expected.x, places=4)
+            self.assertAlmostEqual(pitch.centroid.y, expected.y, places=4)
+
+
+class PitchCentroidTests(TestCase):
+    def setUp(self):
+        self.stadium = Stadium.objects.create(name="Test Ground")
+
+    def square(self, x, y, size=10):
+        return Polygon((
+            (x, y), (x, y + size), (x + size, y + size), (x + size, y), (x, y),
+        ), srid=3857)
+
+    def assertCentroid(self, pitch, x, y):
+        pitch.refresh_from_db()
+        self.assertAlmostEqual(pitch.centroid.x, x)
+        self.assertAlmostEqual(pitch.centroid.y, y)
+
+    def test_save_sets_centroid(self):
+        pitch = Pitch.objects.create(stadium=self.stadium, area=self.square(0, 0))
+        self.assertCentroid(pitch, 5, 5)
+
+    def test_update_fields_area_persists_centroid(self):
+        pitch = Pitch.objects.create(stadium=self.stadium, area=self.square(0, 0))
+        pitch.area = self.square(100, 100)
+        pitch.save(update_fields=["area"])
+        self.assertCentroid(pitch, 105, 105)
+
+    def test_clearing_area_clears_centroid(self):
+        pitch = Pitch.objects.create(stadium=self.stadium, area=self.square(0, 0))
+        pitch.area = None
+        pitch.save()
+        pitch.refresh_from_db()
+        self.assertIsNone(pitch.centroid)
+
+    def test_centroid_without_area_is_kept(self):
+        pitch = Pitch.objects.create(stadium=self.stadium, centroid=Point(1, 2, srid=3857))
+        pitch = Pitch.objects.get(pk=pitch.pk)
+        pitch.name = "Practice"
+        pitch.save()
+        self.assertCentroid(pitch, 1, 2)
+
+    def test_wgs84_area_gets_centroid_in_column_srid(self):
+        area = Polygon(((0, 0), (0, 0.001), (0.001, 0.001), (0.001, 0), (0, 0)), srid=4326)
+        pitch = Pitch.objects.create(stadium=self.stadium, area=area)
+        expected = area.transform(3857, clone=True).centroid
+        self.assertCentroid(pitch, expected.x, expected.y)